@@ -11,6 +11,20 @@ class ClusterController:
     def __init__(self, api_client: ApiClient, cluster_name: Optional[str], cluster_id: Optional[str]):
         self._cluster_service = ClusterService(api_client)
         self.cluster_id = self.preprocess_cluster_args(cluster_name, cluster_id)
+        self._spark_version: Optional[str] = None
+
+    @property
+    def runtime_version(self) -> Optional[int]:
+        """
+        Major DBR version of the cluster, available after awake_cluster is called.
+        Returns None if spark_version doesn't follow the standard format (e.g. 13.3.x-scala2.12).
+        """
+        if not isinstance(self._spark_version, str):
+            return None
+        try:
+            return int(self._spark_version.split(".")[0])
+        except ValueError:
+            return None
 
     def awake_cluster(self):
         with Console().status("Preparing the all-purpose cluster to accept commands", spinner="dots") as status:
@@ -18,6 +32,7 @@ class ClusterController:
 
     def _awake_cluster(self, cluster_id, status: Status):
         cluster_info = self._cluster_service.get_cluster(cluster_id)
+        self._spark_version = cluster_info.get("spark_version")
         if cluster_info["state"] in ["RUNNING", "RESIZING"]:
             status.update("Cluster is ready")
         if cluster_info["state"] in ["TERMINATED", "TERMINATING"]:
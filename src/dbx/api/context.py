@@ -1,3 +1,4 @@
+import mmap
 import time
 from base64 import b64encode
 from pathlib import Path
@@ -123,12 +124,45 @@ class RichExecutionContextClient:
         self.api_client = v2_client
         self._client = LowLevelExecutionContextClient(v2_client, cluster_id, language)
 
+    def _get_local_context(self) -> Optional[ContextInfo]:
+        ctx = LocalContextManager.get_context()
+        return ctx if ctx and ctx.context_id == str(self._client.context_id) else None
+
+    def is_package_installed(self, fingerprint: str) -> bool:
+        ctx = self._get_local_context()
+        return bool(ctx) and fingerprint in ctx.installed_packages
+
+    def mark_package_installed(self, fingerprint: str):
+        """
+        Stores the package fingerprint in the local context info, so that next executions in this context can skip it.
+        Fingerprints of the previous versions of the same package file are replaced.
+        """
+        ctx = self._get_local_context()
+        if not ctx:
+            return
+        package_name = fingerprint.split(":")[0]
+        ctx.installed_packages = [fp for fp in ctx.installed_packages if fp.split(":")[0] != package_name]
+        ctx.installed_packages.append(fingerprint)
+        LocalContextManager.set_context(ctx)
+
     def install_package(self, package_file: str, pip_install_extras: Optional[str]):
-        if pip_install_extras:
-            installation_command = f'%pip install --force-reinstall "{package_file}[{pip_install_extras}]"'
-        else:
-            installation_command = f"%pip install --force-reinstall {package_file}"
-        self._client.execute_command(installation_command, verbose=False)
+        self.install_dependencies(None, package_file, pip_install_extras)
+
+    def install_dependencies(
+        self, requirements_file: Optional[str], package_file: Optional[str], pip_install_extras: Optional[str]
+    ):
+        """
+        Installs the requirements file and the package file.
+        Separate pip calls are used, so that --force-reinstall only applies to the package and not to the requirements.
+        """
+        if requirements_file:
+            self._client.execute_command(f"%pip install -U -r {requirements_file}", verbose=False)
+        if package_file:
+            if pip_install_extras:
+                installation_command = f'%pip install --force-reinstall "{package_file}[{pip_install_extras}]"'
+            else:
+                installation_command = f"%pip install --force-reinstall {package_file}"
+            self._client.execute_command(installation_command, verbose=False)
 
     def setup_arguments(self, arguments: List[Any]):
         task_props = ["python"] + [str(arg) for arg in arguments]
@@ -168,13 +202,21 @@ class RichExecutionContextClient:
         """
         self._client.execute_command(command, verbose=False)
 
+    @staticmethod
+    def _encode_file(file: Path) -> bytes:
+        # file is memory-mapped, so that the encoder reads from the page cache without an intermediate copy
+        with file.open("rb") as _f:
+            if file.stat().st_size == 0:
+                return b64encode(b"")
+            with mmap.mmap(_f.fileno(), 0, access=mmap.ACCESS_READ) as _mapped:
+                return b64encode(_mapped)
+
     def upload_file(self, file: Path, prefix_dir: str) -> str:
         files = list(file.rglob("*")) if file.is_dir() else [file]
         result_data = []
 
         for _file in files:
-            _contents = _file.read_bytes()
-            contents = b64encode(_contents)
+            contents = self._encode_file(_file)
             command = f"""
             from pathlib import Path
             from base64 import b64decode
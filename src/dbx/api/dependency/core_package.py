@@ -29,12 +29,19 @@ class CorePackageManager:
     @staticmethod
     def get_package_file() -> Optional[Path]:
         dbx_echo("Locating package file")
-        file_locator = list(Path("dist").glob("*.whl"))
-        sorted_locator = sorted(
-            file_locator, key=os.path.getmtime
-        )  # get latest modified file, aka latest package version
-        if sorted_locator:
-            file_path = sorted_locator[-1]
+        try:
+            with os.scandir("dist") as entries:
+                # get latest modified file, aka latest package version
+                latest = max(
+                    (entry for entry in entries if entry.is_file() and entry.name.endswith(".whl")),
+                    key=lambda entry: entry.stat().st_mtime,
+                    default=None,
+                )
+        except FileNotFoundError:
+            latest = None
+
+        if latest:
+            file_path = Path("dist") / latest.name
             dbx_echo(f"Package file located in: {file_path}")
             return file_path
         else:
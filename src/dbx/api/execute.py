@@ -1,7 +1,9 @@
+import threading
+from concurrent.futures import Future
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
-import mlflow
 from rich.console import Console
 
 from dbx.api.adjuster.adjuster import AdditionalLibrariesProvider, Adjuster
@@ -13,6 +15,28 @@ from dbx.types import ExecuteTask
 from dbx.utils import dbx_echo
 from dbx.utils.file_uploader import ContextBasedUploader, MlflowFileUploader
 
+_UNSET = object()
+_FILE_PREFIX = "file://"
+
+
+def _submit_in_background(fn: Callable[..., str], *args) -> Future:
+    """
+    Runs the function in a daemon thread, so that a failed or interrupted run doesn't wait for it on exit.
+    Executor workers are always joined at interpreter exit, hence they're not used here.
+    """
+    future = Future()
+
+    def _runner():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:  # noqa
+            future.set_exception(e)
+
+    threading.Thread(target=_runner, daemon=True).start()
+    return future
+
 
 class ExecutionController:
     def __init__(
@@ -24,57 +48,125 @@ class ExecutionController:
         requirements_file: Optional[Path],
         task: ExecuteTask,
         pip_install_extras: Optional[str],
+        runtime_version: Optional[int] = None,
     ):
         self.additional_libraries = AdditionalLibrariesProvider(no_package=no_package, core_package=core_package)
+        self._core_package_path = self._get_local_path(core_package)
         self._client = client
         self._requirements_file = requirements_file
         self._task = task
         self._upload_via_context = upload_via_context
         self._pip_install_extras = pip_install_extras
+        self._package_fingerprint = self._get_package_fingerprint()
         self._run = None
+        self._uploads: Dict[Path, Future] = {}
+        # if the runtime version is known from the cluster metadata, there is no need to request it via command
+        self._runtime_version = runtime_version if runtime_version is not None else _UNSET
+        self._console = Console()
+        self._dispatch: Dict[TaskType, Callable[[], None]] = {
+            TaskType.spark_python_task: self._run_spark_python,
+            TaskType.python_wheel_task: self._run_python_wheel,
+        }
 
         if self._upload_via_context:
             dbx_echo("Context-based file uploader will be used")
             self._file_uploader = ContextBasedUploader(self._client)
         else:
             dbx_echo("Mlflow-based file uploader will be used")
+            import mlflow
+
             self._run = mlflow.start_run()
-            self._file_uploader = MlflowFileUploader(self._run.info.artifact_uri)
+            self._file_uploader = MlflowFileUploader(self._run.info.artifact_uri, run_id=self._run.info.run_id)
+
+    @staticmethod
+    def _get_local_path(package: Optional[Library]) -> Optional[Path]:
+        if not package:
+            return None
+        whl = package.whl
+        return Path(whl[len(_FILE_PREFIX) :] if whl.startswith(_FILE_PREFIX) else whl)
 
     def execute_entrypoint_file(self, _file: Path):
         dbx_echo("Starting entrypoint file execution")
-        with Console().status("Running the entrypoint file", spinner="dots"):
+        with self._console.status("Running the entrypoint file", spinner="dots"):
             self._client.execute_file(_file)
         dbx_echo("Command execution finished")
 
     def execute_entrypoint(self, task: PythonWheelTask):
         dbx_echo("Starting entrypoint execution")
-        with Console().status("Running the entrypoint", spinner="dots"):
+        with self._console.status("Running the entrypoint", spinner="dots"):
             self._client.execute_entry_point(task.package_name, task.entry_point)
         dbx_echo("Entrypoint execution finished")
 
-    def run(self):
-        if self._requirements_file:
-            self.install_requirements_file()
+    def _get_package_fingerprint(self) -> Optional[str]:
+        # rebuilt package keeps its file name, hence size and modification time are part of the fingerprint
+        if not self._core_package_path or not self._core_package_path.exists():
+            return None
+        _stat = self._core_package_path.stat()
+        return f"{self._core_package_path.name}:{_stat.st_size}:{_stat.st_mtime_ns}:{self._pip_install_extras}"
 
-        if not self.additional_libraries.no_package:
-            self.install_package(self._pip_install_extras)
+    @cached_property
+    def _package_required(self) -> bool:
+        if self.additional_libraries.no_package:
+            return False
+        return self._package_fingerprint is None or not self._client.is_package_installed(self._package_fingerprint)
+
+    def _start_uploads(self):
+        """
+        Starts the uploads of the requirements file and the core package in background.
+        Context-based uploader shares the execution context with the installation commands, so it's kept sequential.
+        """
+        self._verify_requirements_file()
+        libs = self.additional_libraries
+        local_files = []
+        if not self._upload_via_context:
+            if self._requirements_file:
+                local_files.append(self._requirements_file)
+            if self._package_required and libs.core_package:
+                local_files.append(self._core_package_path)
 
-        if self._task.task_type == TaskType.spark_python_task:
-            self.preprocess_task_parameters(self._task.spark_python_task.parameters)
-            self.execute_entrypoint_file(self._task.spark_python_task.execute_file)
+        self._uploads = {local_file: _submit_in_background(self._upload, local_file) for local_file in local_files}
 
-        elif self._task.task_type == TaskType.python_wheel_task:
-            if self._task.python_wheel_task.named_parameters:
-                self.preprocess_task_parameters(self._task.python_wheel_task.named_parameters)
-            elif self._task.python_wheel_task.parameters:
-                self.preprocess_task_parameters(self._task.python_wheel_task.parameters)
-            self.execute_entrypoint(self._task.python_wheel_task)
+    def _upload(self, local_file_path: Path) -> str:
+        return self._file_uploader.upload_local_fuse_path(str(local_file_path))
+
+    def _upload_and_provide_path(self, local_file_path: Path) -> str:
+        upload = self._uploads.get(local_file_path)
+        return upload.result() if upload else self._upload(local_file_path)
+
+    def run(self):
+        # uploads run in daemon threads, hence a failed installation is reported without waiting for them
+        self._start_uploads()
+        self.install_dependencies()
+
+        task_runner = self._dispatch.get(self._task.task_type)
+        if task_runner:
+            task_runner()
 
         if self._run:
+            import mlflow
+
             mlflow.end_run()
 
+    def _run_spark_python(self):
+        task = self._task.spark_python_task
+        self.preprocess_task_parameters(task.parameters)
+        self.execute_entrypoint_file(task.execute_file)
+
+    def _run_python_wheel(self):
+        task = self._task.python_wheel_task
+        if task.named_parameters:
+            self.preprocess_task_parameters(task.named_parameters)
+        elif task.parameters:
+            self.preprocess_task_parameters(task.parameters)
+        self.execute_entrypoint(task)
+
     def _identify_runtime_version(self) -> Optional[int]:
+        # runtime version cannot change during the session, hence it's requested from the cluster only once
+        if self._runtime_version is _UNSET:
+            self._runtime_version = self._fetch_runtime_version()
+        return self._runtime_version
+
+    def _fetch_runtime_version(self) -> Optional[int]:
         command = """
         import os
         print(os.environ.get("DATABRICKS_RUNTIME_VERSION"))
@@ -99,32 +191,44 @@ class ExecutionController:
             self._client.client.execute_command(refresh_command, verbose=False)
             dbx_echo("✅ Restarting Python to reflect the changes in environment - done")
 
-    def install_requirements_file(self):
-        if not self._requirements_file.exists():
+    def _verify_requirements_file(self):
+        if self._requirements_file and not self._requirements_file.exists():
             raise Exception(f"Requirements file provided, but doesn't exist at path {self._requirements_file}")
 
-        dbx_echo("Installing provided requirements")
-        localized_requirements_path = self._file_uploader.upload_and_provide_path(
-            f"file:fuse://{self._requirements_file}"
-        )
-        installation_command = f"%pip install -U -r {localized_requirements_path}"
-        self._client.client.execute_command(installation_command, verbose=False)
-        self._refresh_python_if_necessary()
-        dbx_echo("Provided requirements installed")
+    def upload_requirements_file(self) -> str:
+        self._verify_requirements_file()
+        dbx_echo("Uploading provided requirements")
+        localized_requirements_path = self._upload_and_provide_path(self._requirements_file)
+        dbx_echo(":white_check_mark: Uploading provided requirements - done")
+        return localized_requirements_path
 
-    def install_package(self, pip_install_extras: Optional[str]):
+    def upload_package(self) -> str:
         if not self.additional_libraries.core_package:
             raise FileNotFoundError("Project package was not found. Please check that /dist directory exists.")
         dbx_echo("Uploading package")
-        stripped_package_path = self.additional_libraries.core_package.whl.replace("file://", "")
-        localized_package_path = self._file_uploader.upload_and_provide_path(f"file:fuse://{stripped_package_path}")
+        localized_package_path = self._upload_and_provide_path(self._core_package_path)
         dbx_echo(":white_check_mark: Uploading package - done")
+        return localized_package_path
+
+    def install_dependencies(self):
+        localized_requirements_path = self.upload_requirements_file() if self._requirements_file else None
+        if not self.additional_libraries.no_package and not self._package_required:
+            dbx_echo("Package is already installed in the execution context, skipping the package installation")
+        localized_package_path = self.upload_package() if self._package_required else None
+
+        if not (localized_requirements_path or localized_package_path):
+            return
+
+        with self._console.status("Installing dependencies on the cluster 📦", spinner="dots"):
+            self._client.install_dependencies(
+                localized_requirements_path, localized_package_path, self._pip_install_extras
+            )
 
-        with Console().status("Installing package on the cluster 📦", spinner="dots"):
-            self._client.install_package(localized_package_path, pip_install_extras)
+        if localized_package_path and self._package_fingerprint:
+            self._client.mark_package_installed(self._package_fingerprint)
 
         self._refresh_python_if_necessary()
-        dbx_echo(":white_check_mark: Installing package - done")
+        dbx_echo(":white_check_mark: Installing dependencies - done")
 
     def preprocess_task_parameters(self, parameters: Union[List[str], Dict[str, str]]):
         dbx_echo(f":fast_forward: Processing task parameters: {parameters}")
@@ -132,5 +132,6 @@ def execute(
         task=task,
         upload_via_context=upload_via_context,
         pip_install_extras=pip_install_extras,
+        runtime_version=cluster_controller.runtime_version,
     )
     execution_controller.run()
@@ -1,5 +1,9 @@
+from typing import List
+
 from pydantic import BaseModel
 
 
 class ContextInfo(BaseModel):
     context_id: str
+    # fingerprints of the package files installed into this context, reset together with the context
+    installed_packages: List[str] = []
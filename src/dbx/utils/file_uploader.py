@@ -3,7 +3,6 @@ from abc import ABC, abstractmethod
 from pathlib import Path, PurePosixPath
 from typing import Optional, Tuple
 
-import mlflow
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from dbx.api.context import RichExecutionContextClient
@@ -47,9 +46,7 @@ class AbstractFileUploader(ABC):
         if not _path.exists():
             raise FileNotFoundError(f"Provided file reference: {ref} doesn't exist in the local FS")
 
-    @functools.lru_cache(maxsize=3000)
-    def upload_and_provide_path(self, file_reference: str) -> str:
-        local_file_path, as_fuse = self._preprocess_reference(file_reference)
+    def _upload_and_provide_path(self, file_reference: str, local_file_path: Path, as_fuse: bool) -> str:
         self._verify_reference(file_reference, local_file_path)
 
         if as_fuse:
@@ -60,18 +57,40 @@ class AbstractFileUploader(ABC):
         dbx_echo(f":white_check_mark: Uploading local file {local_file_path}")
         return self._postprocess_path(local_file_path, as_fuse)
 
+    @functools.lru_cache(maxsize=3000)
+    def upload_and_provide_path(self, file_reference: str) -> str:
+        local_file_path, as_fuse = self._preprocess_reference(file_reference)
+        return self._upload_and_provide_path(file_reference, local_file_path, as_fuse)
+
+    @functools.lru_cache(maxsize=3000)
+    def upload_local_fuse_path(self, path: str) -> str:
+        """
+        Same as upload_and_provide_path for a file:fuse:// reference, but takes the local path as is.
+        """
+        return self._upload_and_provide_path(path, Path(path), as_fuse=True)
+
 
 class MlflowFileUploader(AbstractFileUploader):
     """
-    MlflowFileUploader represents a class that is used for uploading local files into mlflow storage
+    MlflowFileUploader represents a class that is used for uploading local files into mlflow storage.
+    If run_id is provided, files are logged against this run explicitly, which makes uploads thread-safe.
     """
 
-    @staticmethod
+    def __init__(self, base_uri: Optional[str] = None, run_id: Optional[str] = None):
+        super().__init__(base_uri=base_uri)
+        self.run_id = run_id
+
     @retry(wait=wait_exponential(multiplier=1, min=2, max=5), stop=stop_after_attempt(5))
-    def _upload_file(file_path: Path):
+    def _upload_file(self, file_path: Path):
         posix_path = PurePosixPath(file_path.as_posix())
         parent = str(posix_path.parent) if str(posix_path.parent) != "." else None
-        mlflow.log_artifact(str(file_path), parent)
+        # mlflow is imported on first upload, so that context-based execution doesn't pay for its import
+        import mlflow
+
+        if self.run_id:
+            mlflow.tracking.MlflowClient().log_artifact(self.run_id, str(file_path), parent)
+        else:
+            mlflow.log_artifact(str(file_path), parent)
 
 
 class ContextBasedUploader(AbstractFileUploader):
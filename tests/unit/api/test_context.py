@@ -1,4 +1,11 @@
-from dbx.api.context import LocalContextManager
+from base64 import b64encode
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from dbx.api.context import LocalContextManager, LowLevelExecutionContextClient, RichExecutionContextClient
 from dbx.models.files.context import ContextInfo
 
 
@@ -13,3 +20,33 @@ def test_local_context_non_existent(temp_project):
     LocalContextManager.context_file_path.unlink(missing_ok=True)
     result = LocalContextManager.get_context()
     assert result is None
+
+
+@pytest.mark.parametrize("payload", [b"", b"some-wheel-content"])
+def test_upload_file_contents(payload, mocker: MockerFixture, temp_project):
+    exec_mock = mocker.patch.object(
+        LowLevelExecutionContextClient, "execute_command", MagicMock(return_value="/tmp/prefix/some-file.whl")
+    )
+    client = RichExecutionContextClient(v2_client=MagicMock(), cluster_id="a")
+    local_file = Path("some-file.whl")
+    local_file.write_bytes(payload)
+    client.upload_file(local_file, "/tmp/prefix")
+    assert f"b64decode({b64encode(payload)})" in exec_mock.call_args.args[0]
+
+
+def test_installed_packages_follow_context(mocker: MockerFixture, temp_project):
+    mocker.patch.object(LowLevelExecutionContextClient, "execute_command", MagicMock())
+    client = RichExecutionContextClient(v2_client=MagicMock(), cluster_id="a")
+    fingerprint = "pkg-0.0.1-py3-none-any.whl:1:1:None"
+    assert not client.is_package_installed(fingerprint)
+
+    client.mark_package_installed(fingerprint)
+    assert client.is_package_installed(fingerprint)
+
+    rebuilt_fingerprint = "pkg-0.0.1-py3-none-any.whl:2:2:None"
+    client.mark_package_installed(rebuilt_fingerprint)
+    assert LocalContextManager.get_context().installed_packages == [rebuilt_fingerprint]
+
+    # new context is stored without the installed packages
+    LocalContextManager.set_context(ContextInfo(context_id="some-new-context"))
+    assert not client.is_package_installed(rebuilt_fingerprint)
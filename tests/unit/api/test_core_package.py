@@ -0,0 +1,43 @@
+import os
+from pathlib import Path
+
+from dbx.api.dependency.core_package import CorePackageManager
+
+
+def test_package_file_located_after_build(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert CorePackageManager.get_package_file() is None
+
+    (tmp_path / "dist").mkdir()
+    (tmp_path / "dist" / "pkg-0.0.2-py3-none-any.whl").write_bytes(b"a")
+    assert CorePackageManager.get_package_file() == Path("dist/pkg-0.0.2-py3-none-any.whl")
+
+
+def test_latest_package_file_selected(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "dist").mkdir()
+    (tmp_path / "dist" / "pkg-0.0.1.tar.gz").write_bytes(b"a")
+    for idx, version in enumerate(["0.0.3", "0.0.1", "0.0.2"]):
+        wheel = tmp_path / "dist" / f"pkg-{version}-py3-none-any.whl"
+        wheel.write_bytes(b"a")
+        os.utime(wheel, (idx, idx))
+
+    assert CorePackageManager.get_package_file() == Path("dist/pkg-0.0.2-py3-none-any.whl")
+
+
+def test_package_file_rewritten_in_place(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "dist").mkdir()
+    old_wheel = tmp_path / "dist" / "pkg-0.0.1-py3-none-any.whl"
+    new_wheel = tmp_path / "dist" / "pkg-0.0.2-py3-none-any.whl"
+    for idx, wheel in enumerate([old_wheel, new_wheel]):
+        wheel.write_bytes(b"a")
+        os.utime(wheel, (idx, idx))
+
+    assert CorePackageManager.get_package_file() == Path("dist/pkg-0.0.2-py3-none-any.whl")
+
+    dist_stat = (tmp_path / "dist").stat()
+    old_wheel.write_bytes(b"rebuilt")
+    os.utime(old_wheel, (10, 10))
+    assert (tmp_path / "dist").stat().st_mtime_ns == dist_stat.st_mtime_ns
+    assert CorePackageManager.get_package_file() == Path("dist/pkg-0.0.1-py3-none-any.whl")
@@ -1,8 +1,19 @@
-from unittest.mock import MagicMock
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, call
 
+import pytest
 from pytest_mock import MockerFixture
 
 from dbx.api.context import LowLevelExecutionContextClient, RichExecutionContextClient
+from dbx.api.execute import ExecutionController
+from dbx.utils.file_uploader import MlflowFileUploader
+from tests.unit.conftest import ExecutionControllerFactory
 
 
 def test_execution_controller(mocker: MockerFixture, temp_project):
@@ -12,3 +23,135 @@ def test_execution_controller(mocker: MockerFixture, temp_project):
     exec_mock.assert_called_once_with(
         f'%pip install --force-reinstall "/some/whatever/file[some-extras]"', verbose=False
     )
+
+
+def test_execution_controller_uploads(execution_controller_factory: ExecutionControllerFactory):
+    factory = execution_controller_factory
+    factory(requirements_file=factory.requirements_file).run()
+
+    assert MlflowFileUploader._upload_file.call_count == 2
+    localized_requirements, localized_package, _ = factory.client.install_dependencies.call_args.args
+    assert localized_requirements.endswith(f"{factory.requirements_file}")
+    assert localized_package.endswith(f"{factory.package_file}")
+
+
+def test_single_python_restart(execution_controller_factory: ExecutionControllerFactory):
+    factory = execution_controller_factory
+    factory.client.client.execute_command.return_value = "13.0"
+    factory(requirements_file=factory.requirements_file).run()
+
+    commands = [_call.args[0] for _call in factory.client.client.execute_command.call_args_list]
+    assert len([c for c in commands if "DATABRICKS_RUNTIME_VERSION" in c]) == 1
+    assert commands.count("dbutils.library.restartPython()") == 1
+
+
+def test_install_dependencies_commands(mocker: MockerFixture, temp_project):
+    exec_mock = mocker.patch.object(LowLevelExecutionContextClient, "execute_command", MagicMock())
+    client = RichExecutionContextClient(v2_client=MagicMock(), cluster_id="a")
+    client.install_dependencies("/some/requirements.txt", "/some/whatever/file", "some-extras")
+    assert exec_mock.call_args_list == [
+        call("%pip install -U -r /some/requirements.txt", verbose=False),
+        call('%pip install --force-reinstall "/some/whatever/file[some-extras]"', verbose=False),
+    ]
+
+
+def test_runtime_version_from_cluster_metadata(execution_controller_factory: ExecutionControllerFactory):
+    factory = execution_controller_factory
+    factory(runtime_version=12).run()
+
+    factory.client.client.execute_command.assert_not_called()
+
+
+def test_installed_package_skipped(execution_controller_factory: ExecutionControllerFactory):
+    factory = execution_controller_factory
+    installed_packages = set()
+    factory.client.is_package_installed.side_effect = installed_packages.__contains__
+    factory.client.mark_package_installed.side_effect = installed_packages.add
+
+    factory(runtime_version=12).run()
+    factory(runtime_version=12).run()
+    assert factory.client.install_dependencies.call_count == 1
+
+    factory.package_file.write_bytes(b"rebuilt")
+    factory(runtime_version=12).run()
+    assert factory.client.install_dependencies.call_count == 2
+
+
+def test_failed_install_does_not_wait_for_uploads(
+    execution_controller_factory: ExecutionControllerFactory, mocker: MockerFixture
+):
+    factory = execution_controller_factory
+    package_upload_released = threading.Event()
+
+    def _upload(local_file_path):
+        if local_file_path == factory.requirements_file:
+            raise FileNotFoundError("requirements upload failed")
+        package_upload_released.wait(timeout=30)
+        return "/dbfs/some/pkg.whl"
+
+    mocker.patch.object(ExecutionController, "_upload", side_effect=_upload)
+    controller = factory(requirements_file=factory.requirements_file)
+
+    started = time.monotonic()
+    with pytest.raises(FileNotFoundError):
+        controller.run()
+    assert time.monotonic() - started < 10
+    package_upload_released.set()
+
+
+def test_failed_install_process_exits_without_waiting_for_uploads(tmp_path: Path):
+    script = tmp_path / "failed_install.py"
+    script.write_text(
+        textwrap.dedent(
+            """
+            import time
+            from pathlib import Path
+            from unittest.mock import MagicMock, patch
+
+            from dbx.api.execute import ExecutionController
+            from dbx.models.workflow.common.libraries import Library
+
+            Path("pkg-0.0.1-py3-none-any.whl").write_bytes(b"a")
+            Path("requirements.txt").write_text("tqdm")
+
+            def _upload(local_file_path):
+                if local_file_path.name == "requirements.txt":
+                    raise FileNotFoundError("requirements upload failed")
+                time.sleep(30)
+
+            with patch.object(ExecutionController, "_upload", side_effect=_upload):
+                ExecutionController(
+                    client=MagicMock(**{"is_package_installed.return_value": False}),
+                    no_package=False,
+                    core_package=Library(whl="file://pkg-0.0.1-py3-none-any.whl"),
+                    upload_via_context=False,
+                    requirements_file=Path("requirements.txt"),
+                    task=MagicMock(),
+                    pip_install_extras=None,
+                ).run()
+            """
+        )
+    )
+
+    started = time.monotonic()
+    result = subprocess.run(
+        [sys.executable, str(script)],
+        cwd=tmp_path,
+        env={**os.environ, "MLFLOW_TRACKING_URI": (tmp_path / "mlruns").as_uri()},
+        capture_output=True,
+        timeout=60,
+    )
+    assert result.returncode != 0
+    assert b"requirements upload failed" in result.stderr
+    assert time.monotonic() - started < 20
+
+
+def test_missing_requirements_file_does_not_start_uploads(
+    execution_controller_factory: ExecutionControllerFactory, mocker: MockerFixture
+):
+    factory = execution_controller_factory
+    upload_mock = mocker.patch.object(ExecutionController, "_upload", MagicMock())
+
+    with pytest.raises(Exception, match="Requirements file provided, but doesn't exist"):
+        factory(requirements_file=factory.requirements_file.with_name("missing.txt")).run()
+    upload_mock.assert_not_called()
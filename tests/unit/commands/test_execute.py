@@ -292,12 +292,13 @@ def test_awake_cluster(*_):
     side_effect = [
         {"state": "TERMINATED"},
         {"state": "PENDING"},
-        {"state": "RUNNING"},
+        {"state": "RUNNING", "spark_version": "13.3.x-scala2.12"},
         {"state": "RUNNING"},
     ]
     with patch.object(ClusterService, "get_cluster", side_effect=side_effect) as cluster_service_mock:
         controller = ClusterController(client_mock, None, "aaa-bbb-ccc")
         controller.awake_cluster()
+        assert controller.runtime_version == 13
         assert cluster_service_mock("aaa-bbb").get("state") == "RUNNING"
 
     with patch.object(ClusterService, "get_cluster", return_value={"state": "ERROR"}):
@@ -4,7 +4,7 @@ import os
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 from unittest.mock import MagicMock
 from uuid import uuid4
 
@@ -15,11 +15,13 @@ from pytest_mock import MockerFixture
 from typer.testing import CliRunner
 
 from dbx.api.client_provider import DatabricksClientProvider
+from dbx.api.execute import ExecutionController
 from dbx.api.launch.pipeline_models import PipelineGlobalState
 from dbx.api.storage.io import StorageIO
 from dbx.api.storage.mlflow_based import MlflowStorageConfigurationManager
 from dbx.cli import app
 from dbx.commands.init import init
+from dbx.models.workflow.common.libraries import Library
 from dbx.utils.file_uploader import MlflowFileUploader
 from tests.unit.api.launch.test_pipeline_runner import TEST_PIPELINE_ID, TEST_PIPELINE_UPDATE_PAYLOAD
 
@@ -146,6 +148,42 @@ def mlflow_file_uploader(mocker, mlflow_fixture):
     mocker.patch.object(MlflowFileUploader, "_postprocess_path", MagicMock(side_effect=_mocked_processor))
 
 
+class ExecutionControllerFactory:
+    """
+    Builds ExecutionController instances with a local wheel, a requirements file and a mocked context client.
+    Keyword arguments passed to the call override the default controller arguments.
+    """
+
+    def __init__(self, tmp_path: Path):
+        self.package_file = tmp_path / "pkg-0.0.1-py3-none-any.whl"
+        self.package_file.write_bytes(b"a")
+        self.requirements_file = tmp_path / "requirements.txt"
+        self.requirements_file.write_text("tqdm")
+        self.client = MagicMock()
+        self.client.client.execute_command.return_value = "12.2"
+        self.client.is_package_installed.return_value = False
+
+    def __call__(self, **kwargs) -> ExecutionController:
+        arguments = dict(
+            client=self.client,
+            no_package=False,
+            core_package=Library(whl=f"file://{self.package_file}"),
+            upload_via_context=False,
+            requirements_file=None,
+            task=MagicMock(),
+            pip_install_extras=None,
+        )
+        arguments.update(kwargs)
+        return ExecutionController(**arguments)
+
+
+@pytest.fixture(scope="function")
+def execution_controller_factory(tmp_path: Path, mlflow_file_uploader) -> Iterator[ExecutionControllerFactory]:
+    yield ExecutionControllerFactory(tmp_path)
+    # runs of the controllers that failed on purpose are not ended by the controller itself
+    mlflow.end_run()
+
+
 @pytest.fixture()
 def mock_storage_io(mocker):
     mocker.patch.object(StorageIO, "save", MagicMock())
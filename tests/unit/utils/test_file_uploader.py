@@ -22,3 +22,10 @@ def test_fuse_support(artifact_uri, mocker):
                 [artifact_uri.replace("dbfs:/", "/dbfs/"), test_reference.replace("file:fuse://", "")]
             )
             assert expected_path == resulting_path
+
+
+def test_local_fuse_path(mocker):
+    mocker.patch("mlflow.log_artifact", return_value=None)
+    mocker.patch("dbx.utils.file_uploader.MlflowFileUploader._verify_reference", return_value=None)
+    uploader = MlflowFileUploader(base_uri="dbfs:/some/prefix")
+    assert uploader.upload_local_fuse_path("some-path") == uploader.upload_and_provide_path("file:fuse://some-path")